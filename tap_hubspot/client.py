@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import io
+import re
 import sys
+import orjson
 import requests
 import datetime
 
-from typing import Any, Callable
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Iterable
 
+from requests.adapters import HTTPAdapter
+from singer_sdk import _singerlib as singer
 from singer_sdk import typing as th
+from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseAPIPaginator
 from singer_sdk.streams import RESTStream
 from singer_sdk._singerlib.utils import strptime_to_utc
@@ -29,22 +38,125 @@ if sys.version_info < (3, 11):
 
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
 
+SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
+
+# Largest page HubSpot serves from its list and search endpoints
+MAX_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=None)
+def _load_schema(name: str) -> dict:
+    """Return the JSON schema in schemas/<name>.json, parsed once per process."""
+    return orjson.loads((SCHEMAS_DIR / f"{name}.json").read_bytes())
+
+
+# Matches record paths of the form "$[results][*]"
+_TOP_LEVEL_ARRAY_JSONPATH = re.compile(r"^\$\[(\w+)\]\[\*\]$")
+
+
+def _top_level_array_key(expression: str) -> str | None:
+    """Return the key selected by a "$[key][*]" expression, if it is one."""
+    match = _TOP_LEVEL_ARRAY_JSONPATH.match(expression)
+    return match.group(1) if match else None
+
+
+# Upper bound on concurrent keep-alive connections to api.hubapi.com. Threaded
+# fan-outs should not run more workers than this, or the extra connections are
+# opened and discarded instead of being reused.
+POOL_MAXSIZE = 20
+
+
+@lru_cache(maxsize=None)
+def _shared_session() -> requests.Session:
+    """Return the HTTP session shared by every HubSpot stream."""
+    # With brotli installed, requests advertises and decodes "br" alongside
+    # gzip in its default Accept-Encoding header.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _record_message_prefix(stream: str) -> bytes:
+    """Return the serialized RECORD envelope up to the record payload."""
+    return b'{"type":"RECORD","stream":' + orjson.dumps(stream) + b',"record":'
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values orjson cannot serialize.
+
+    Decimals are written verbatim as JSON numbers, so no precision is lost,
+    and anything else falls back to its string form.
+    """
+    if isinstance(obj, Decimal):
+        return orjson.Fragment(str(obj))
+    return str(obj)
+
+
+def _write_record_line(message: singer.RecordMessage) -> None:
+    """Write a RECORD message to stdout using orjson.
+
+    Produces the same JSON document as ``singer.write_message``, though not
+    byte for byte: separators are compact and non-ASCII text is written as
+    UTF-8 rather than escaped. Only the record payload is encoded per message;
+    the envelope prefix is cached per stream.
+
+    Lines go to the buffered binary stdout without a flush per record, so
+    consecutive records are coalesced into fewer writes. ``BufferedWriter``
+    accepts every byte or raises, so a line is never silently truncated. The
+    SDK flushes stdout after every other message it writes, so records are
+    always pushed out ahead of the STATE message that follows them.
+
+    When stdout has no buffered binary layer (captured output, or ``python -u``
+    and ``PYTHONUNBUFFERED`` where it is a raw ``FileIO``), the message is left
+    to ``singer.write_message``.
+    """
+    stdout = getattr(sys.stdout, "buffer", None)
+    if not isinstance(stdout, io.BufferedWriter):
+        singer.write_message(message)
+        return
+    line = _record_message_prefix(message.stream) + orjson.dumps(
+        message.record,
+        default=_json_default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+    if message.version is not None:
+        line += b',"version":' + orjson.dumps(message.version)
+    if message.time_extracted is not None:
+        line += b',"time_extracted":' + orjson.dumps(str(message.time_extracted))
+    stdout.write(line + b"}\n")
+
 
 class HubspotStream(RESTStream):
     """tap-hubspot stream class."""
 
-    @property
-    def url_base(self) -> str:
-        """
-        Returns base url
-        """
-        return "https://api.hubapi.com/"
-
+    url_base = "https://api.hubapi.com/"
     records_jsonpath = "$[*]"  # Or override `parse_response`.
 
     # Set this value or override `get_new_paginator`.
     next_page_token_jsonpath = "$.next_page"
 
+    # File in SCHEMAS_DIR holding the stream schema, defaults to the stream name
+    schema_name: ClassVar[str | None] = None
+
+    # Key of the top level records array, resolved from `records_jsonpath`
+    _records_key: ClassVar[str | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve `records_jsonpath` once per stream class."""
+        super().__init_subclass__(**kwargs)
+        cls._records_key = _top_level_array_key(cls.records_jsonpath)
+
+    @cached_property
+    def schema(self) -> dict:
+        """Return the stream schema, loaded from `SCHEMAS_DIR` on first use.
+
+        Returns:
+            The JSON schema for records in this stream.
+        """
+        return _load_schema(self.schema_name or self.name)
+
     @cached_property
     def authenticator(self) -> _Auth:
         """Return a new authenticator object.
@@ -64,6 +176,53 @@ class HubspotStream(RESTStream):
                 token=self.config.get("access_token"),
             )
 
+    def build_prepared_request(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.PreparedRequest:
+        """Build a request authenticated with this stream's authenticator.
+
+        The SDK assigns the authenticator to the session before preparing each
+        request. The session is shared by all streams, some of which run in
+        worker threads, so the authenticator is attached to the request itself.
+
+        Args:
+            *args: Arguments to pass to `requests.Request`.
+            **kwargs: Keyword arguments to pass to `requests.Request`.
+
+        Returns:
+            A `requests.PreparedRequest` object.
+        """
+        request = requests.Request(*args, auth=self.authenticator, **kwargs)
+        return self.requests_session.prepare_request(request)
+
+    @property
+    def page_size(self) -> int:
+        """Return the number of records to request per page.
+
+        Raises:
+            ValueError: If the configured page size is outside 1..100.
+        """
+        page_size = self.config.get("page_size", 100)
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(
+                f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}"
+            )
+        return page_size
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Get the requests session shared by all HubSpot streams.
+
+        Every stream talks to api.hubapi.com, so a single keep-alive pool lets
+        each stream and page reuse an open TLS connection.
+
+        Returns:
+            The shared `requests.Session` object.
+        """
+        return _shared_session()
+
     @property
     def http_headers(self) -> dict:
         """Return the http headers needed.
@@ -100,7 +259,7 @@ class HubspotStream(RESTStream):
         # If pagination is required, return a token which can be used to get the
         #       next page. If this is the final page, return "None" to end the
         #       pagination loop.
-        resp_json = response.json()
+        resp_json = self._decode_response(response)
         paging = resp_json.get("paging")
 
         if paging is not None:
@@ -109,6 +268,56 @@ class HubspotStream(RESTStream):
             next_page_token = None
         return next_page_token
 
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records.
+
+        HubSpot wraps records in a single top level array, so "$[key][*]"
+        expressions are resolved to a key when the stream class is defined and
+        read with a dict lookup instead of a JSONPath traversal. Any other
+        expression falls back to the SDK JSONPath helper.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Yields:
+            Each record from the source.
+        """
+        data = self._decode_response(response)
+        if self._records_key is None:
+            yield from extract_jsonpath(self.records_jsonpath, input=data)
+            return
+        yield from data.get(self._records_key) or []
+
+    def _decode_response(self, response: requests.Response) -> Any:
+        """Decode a JSON response body with orjson.
+
+        The body of the most recent response is kept so that the records and
+        the pagination token are read from a single parse.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Returns:
+            The decoded response body.
+        """
+        cached = getattr(self, "_decoded_response", None)
+        if cached is not None and cached[0] is response:
+            return cached[1]
+        data = orjson.loads(response.content)
+        self._decoded_response = (response, data)
+        return data
+
+    def _write_record_message(self, record: dict) -> None:
+        """Write out a RECORD message.
+
+        Args:
+            record: A single stream record.
+        """
+        for record_message in self._generate_record_messages(record):
+            _write_record_line(record_message)
+
+        self._is_state_flushed = False
+
     def get_url_params(
         self,
         context: dict | None,
@@ -124,7 +333,7 @@ class HubspotStream(RESTStream):
             A dictionary of URL query parameters.
         """
         params: dict = {}
-        params["limit"] = 100
+        params["limit"] = self.page_size
         if next_page_token:
             params["after"] = next_page_token
         if self.replication_key:
@@ -134,7 +343,44 @@ class HubspotStream(RESTStream):
 
 
 
-class DynamicHubspotStream(HubspotStream):
+class CrmHubspotStream(HubspotStream):
+    """Base class for streams served by the CRM v3 API."""
+
+    url_base = "https://api.hubapi.com/crm/v3"
+    primary_keys = ["id"]
+    records_jsonpath = "$[results][*]"
+
+    def get_url_params(
+        self,
+        context: dict | None,
+        next_page_token: Any | None,
+    ) -> dict[str, Any]:
+        """Return a dictionary of values to be used in URL parameterization.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            A dictionary of URL query parameters.
+        """
+        params = super().get_url_params(context, next_page_token)
+        if self._properties_param:
+            params["properties"] = self._properties_param
+        return params
+
+    @cached_property
+    def _properties_param(self) -> str:
+        """The object properties declared in the schema, joined once per stream.
+
+        HubSpot only returns a handful of default properties unless they are
+        requested, and anything outside the schema is dropped on output anyway.
+        """
+        properties = self.schema["properties"].get("properties", {})
+        return ",".join(properties.get("properties", {}))
+
+
+class DynamicHubspotStream(CrmHubspotStream):
     """DynamicHubspotStream"""
 
     def __init__(self, *args, **kwargs):
@@ -165,35 +411,15 @@ class DynamicHubspotStream(HubspotStream):
         return schema.to_dict()
 
     def _get_available_properties(self) -> dict[str, str]:
-        session = requests.Session()
-        session.auth = self.authenticator
-
-        resp = session.get(
-            f"https://api.hubapi.com/crm/v3/properties/{self.name}",
+        resp = self.requests_session.get(
+            f"{self.url_base}/properties/{self.name}",
+            auth=self.authenticator,
+            timeout=self.timeout,
         )
         resp.raise_for_status()
-        results = resp.json().get("results", [])
+        results = orjson.loads(resp.content).get("results", [])
         return {prop["name"]: prop["type"] for prop in results}
 
-    def get_url_params(
-        self,
-        context: dict | None,
-        next_page_token: Any | None,
-    ) -> dict[str, Any]:
-        """Return a dictionary of values to be used in URL parameterization.
-
-        Args:
-            context: The stream context.
-            next_page_token: The next page index or value.
-
-        Returns:
-            A dictionary of URL query parameters.
-        """
-        params = super().get_url_params(context, next_page_token)
-        if self.hs_properties:
-            params["properties"] = ",".join(self.hs_properties)
-        return params
-
 
 class DynamicIncrementalHubspotStream(DynamicHubspotStream):
     """DynamicIncrementalHubspotStream"""
@@ -312,7 +538,7 @@ class DynamicIncrementalHubspotStream(DynamicHubspotStream):
             if next_page_token:
                 # Hubspot wont return more than 10k records so when we hit 10k we
                 # need to reset our epoch to most recent and not send the next_page_token
-                if int(next_page_token) + 100 >= 10000:
+                if int(next_page_token) + self.page_size >= 10000:
                     ts = strptime_to_utc(
                         self.get_context_state(context).get("progress_markers").get("replication_key_value")
                     )
@@ -343,7 +569,7 @@ class DynamicIncrementalHubspotStream(DynamicHubspotStream):
                         }
                     ],
                     # Hubspot sets a limit of most 100 per request. Default is 10
-                    "limit": 100,
+                    "limit": self.page_size,
                     "properties": list(self.hs_properties)
                 }
             )
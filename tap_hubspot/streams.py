@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import sys
 
-from singer_sdk import typing as th  # JSON Schema typing helpers
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from tap_hubspot.client import DynamicHubspotStream, DynamicIncrementalHubspotStream, HubspotStream
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    from cached_property import cached_property
 
-PropertiesList = th.PropertiesList
-Property = th.Property
-ObjectType = th.ObjectType
-DateTimeType = th.DateTimeType
-StringType = th.StringType
-ArrayType = th.ArrayType
-BooleanType = th.BooleanType
-IntegerType = th.IntegerType
+from tap_hubspot.client import (
+    POOL_MAXSIZE,
+    CrmHubspotStream,
+    DynamicHubspotStream,
+    DynamicIncrementalHubspotStream,
+    HubspotStream,
+)
 
 
 class ContactStream(DynamicIncrementalHubspotStream):
@@ -36,17 +39,8 @@ class ContactStream(DynamicIncrementalHubspotStream):
     name = "contacts"
     path = "/objects/contacts"
     incremental_path = "/objects/contacts/search"
-    primary_keys = ["id"]
     replication_key = "lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class UsersStream(HubspotStream):
@@ -68,24 +62,10 @@ class UsersStream(HubspotStream):
     path = "/users"
     primary_keys = ["id"]
     records_jsonpath = "$[results][*]"  # Or override `parse_response`.
+    url_base = "https://api.hubapi.com/settings/v3"
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("email", StringType),
-        Property("roleIds", ArrayType(StringType)),
-        Property("primaryteamid", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-
-        return "https://api.hubapi.com/settings/v3"
 
-
-class OwnersStream(HubspotStream):
+class OwnersStream(CrmHubspotStream):
 
     """
     https://developers.hubspot.com/docs/api/crm/owners#endpoint?spec=GET-/crm/v3/owners/
@@ -102,26 +82,6 @@ class OwnersStream(HubspotStream):
 
     name = "owners"
     path = "/owners"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("email", StringType),
-        Property("firstName", StringType),
-        Property("lastName", StringType),
-        Property("userId", IntegerType),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class TicketPipelineStream(HubspotStream):
@@ -143,45 +103,7 @@ class TicketPipelineStream(HubspotStream):
     path = "/pipelines/tickets"
     primary_keys = ["createdAt"]
     records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("label", StringType),
-        Property("displayOrder", IntegerType),
-        Property("active", BooleanType),
-        Property(
-            "stages",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property(
-                        "metadata",
-                        ObjectType(
-                            Property("ticketState", StringType),
-                            Property("isClosed", StringType),
-                        ),
-                    ),
-                    Property("stageId", StringType),
-                    Property("createdAt", IntegerType),
-                    Property("updatedAt", StringType),
-                    Property("active", BooleanType),
-                ),
-            ),
-        ),
-        Property("objectType", StringType),
-        Property("objectTypeId", StringType),
-        Property("pipelineId", StringType),
-        Property("createdAt", IntegerType),
-        Property("updatedAt", StringType),
-        Property("default", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm-pipelines/v1"
+    url_base = "https://api.hubapi.com/crm-pipelines/v1"
 
 
 class DealPipelineStream(HubspotStream):
@@ -203,45 +125,7 @@ class DealPipelineStream(HubspotStream):
     path = "/pipelines/deals"
     primary_keys = ["createdAt"]
     records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("label", StringType),
-        Property("displayOrder", IntegerType),
-        Property("active", BooleanType),
-        Property(
-            "stages",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property(
-                        "metadata",
-                        ObjectType(
-                            Property("isClosed", BooleanType),
-                            Property("probability", StringType),
-                        ),
-                    ),
-                    Property("stageId", StringType),
-                    Property("createdAt", IntegerType),
-                    Property("updatedAt", IntegerType),
-                    Property("active", BooleanType),
-                ),
-            ),
-        ),
-        Property("objectType", StringType),
-        Property("objectTypeId", StringType),
-        Property("pipelineId", StringType),
-        Property("createdAt", IntegerType),
-        Property("updatedAt", IntegerType),
-        Property("default", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm-pipelines/v1"
+    url_base = "https://api.hubapi.com/crm-pipelines/v1"
 
 
 class EmailSubscriptionStream(HubspotStream):
@@ -263,846 +147,97 @@ class EmailSubscriptionStream(HubspotStream):
     path = "/subscriptions"
     primary_keys = ["id"]
     records_jsonpath = "$[subscriptionDefinitions][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", IntegerType),
-        Property("portalId", IntegerType),
-        Property("name", StringType),
-        Property("description", StringType),
-        Property("active", BooleanType),
-        Property("internal", BooleanType),
-        Property("category", StringType),
-        Property("channel", StringType),
-        Property("internalName", StringType),
-        Property("businessUnitId", IntegerType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/email/public/v1"
-
-
-class PropertyTicketStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_tickets"
-    path = "/properties/tickets"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyDealStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_deals"
-    path = "/properties/deals"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-        Property("calculationFormula", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyContactStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_contacts"
-    path = "/properties/contacts"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyCompanyStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_companies"
-    path = "/properties/company"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyProductStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_products"
-    path = "/properties/product"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyLineItemStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_line_items"
-    path = "/properties/line_item"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyEmailStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_emails"
-    path = "/properties/email"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyPostalMailStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_postal_mails"
-    path = "/properties/postal_mail"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyCallStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_calls"
-    path = "/properties/call"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyMeetingStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_meetings"
-    path = "/properties/meeting"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyTaskStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_tasks"
-    path = "/properties/task"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyCommunicationStream(HubspotStream):
-
-    """
-    https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    records_jsonpath = json response body
-    """
-
-    name = "property_communications"
-    path = "/properties/communication"
-    primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
-
-
-class PropertyNotesStream(HubspotStream):
+    url_base = "https://api.hubapi.com/email/public/v1"
+
+
+def _make_property_stream(
+    class_name: str,
+    name: str,
+    path: str,
+    schema_name: str = "properties",
+) -> type[CrmHubspotStream]:
+    """
+    Builds a stream class for a /crm/v3/properties/{objectType} endpoint
+    https://developers.hubspot.com/docs/api/crm/properties
+    """
+
+    return type(
+        class_name,
+        (CrmHubspotStream,),
+        {
+            "__module__": __name__,
+            "name": name,
+            "path": path,
+            "primary_keys": ["label"],
+            "schema_name": schema_name,
+        },
+    )
+
+
+PropertyTicketStream = _make_property_stream(
+    "PropertyTicketStream",
+    "property_tickets",
+    "/properties/tickets",
+)
+PropertyDealStream = _make_property_stream(
+    "PropertyDealStream",
+    "property_deals",
+    "/properties/deals",
+    schema_name="property_deals",
+)
+PropertyContactStream = _make_property_stream(
+    "PropertyContactStream",
+    "property_contacts",
+    "/properties/contacts",
+)
+PropertyCompanyStream = _make_property_stream(
+    "PropertyCompanyStream",
+    "property_companies",
+    "/properties/company",
+)
+PropertyProductStream = _make_property_stream(
+    "PropertyProductStream",
+    "property_products",
+    "/properties/product",
+)
+PropertyLineItemStream = _make_property_stream(
+    "PropertyLineItemStream",
+    "property_line_items",
+    "/properties/line_item",
+)
+PropertyEmailStream = _make_property_stream(
+    "PropertyEmailStream",
+    "property_emails",
+    "/properties/email",
+)
+PropertyPostalMailStream = _make_property_stream(
+    "PropertyPostalMailStream",
+    "property_postal_mails",
+    "/properties/postal_mail",
+)
+PropertyCallStream = _make_property_stream(
+    "PropertyCallStream",
+    "property_calls",
+    "/properties/call",
+)
+PropertyMeetingStream = _make_property_stream(
+    "PropertyMeetingStream",
+    "property_meetings",
+    "/properties/meeting",
+)
+PropertyTaskStream = _make_property_stream(
+    "PropertyTaskStream",
+    "property_tasks",
+    "/properties/task",
+)
+PropertyCommunicationStream = _make_property_stream(
+    "PropertyCommunicationStream",
+    "property_communications",
+    "/properties/communication",
+)
+
+
+class PropertyNotesStream(CrmHubspotStream):
 
     """
     https://developers.hubspot.com/docs/api/crm/properties#endpoint?spec=PATCH-/crm/v3/properties/{objectType}/{propertyName}
@@ -1120,93 +255,48 @@ class PropertyNotesStream(HubspotStream):
     name = "properties"
     path = "/properties/notes"
     primary_keys = ["label"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
 
-    schema = PropertiesList(
-        Property("updatedAt", StringType),
-        Property("createdAt", StringType),
-        Property("name", StringType),
-        Property("label", StringType),
-        Property("type", StringType),
-        Property("fieldType", StringType),
-        Property("description", StringType),
-        Property("groupName", StringType),
-        Property(
-            "options",
-            ArrayType(
-                ObjectType(
-                    Property("label", StringType),
-                    Property("description", StringType),
-                    Property("value", StringType),
-                    Property("displayOrder", IntegerType),
-                    Property("hidden", BooleanType),
-                ),
-            ),
-        ),
-        Property("displayOrder", IntegerType),
-        Property("calculated", BooleanType),
-        Property("externalOptions", BooleanType),
-        Property("hasUniqueValue", BooleanType),
-        Property("hidden", BooleanType),
-        Property("hubspotDefined", BooleanType),
-        Property(
-            "modificationMetadata",
-            ObjectType(
-                Property("readOnlyOptions", BooleanType),
-                Property("readOnlyValue", BooleanType),
-                Property("readOnlyDefinition", BooleanType),
-                Property("archivable", BooleanType),
-            ),
-        ),
-        Property("formField", BooleanType),
-        Property("hubspot_object", StringType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
+    @cached_property
+    def _substreams(self) -> list[CrmHubspotStream]:
+        """The per-object property streams merged into this one, built once."""
+        return [
+            stream_class(self._tap, schema={"properties": {}})
+            for stream_class in (
+                PropertyTicketStream,
+                PropertyDealStream,
+                PropertyContactStream,
+                PropertyCompanyStream,
+                PropertyProductStream,
+                PropertyLineItemStream,
+                PropertyEmailStream,
+                PropertyPostalMailStream,
+                PropertyCallStream,
+                PropertyMeetingStream,
+                PropertyTaskStream,
+                PropertyCommunicationStream,
+            )
+        ]
 
     def get_records(self, context: dict | None) -> Iterable[dict[str, Any]]:
         """
         Merges all the property stream data into a single property table
         """
 
-        property_ticket = PropertyTicketStream(self._tap, schema={"properties": {}})
-        property_deal = PropertyDealStream(self._tap, schema={"properties": {}})
-        property_contact = PropertyContactStream(self._tap, schema={"properties": {}})
-        property_company = PropertyCompanyStream(self._tap, schema={"properties": {}})
-        property_product = PropertyProductStream(self._tap, schema={"properties": {}})
-        property_lineitem = PropertyLineItemStream(self._tap, schema={"properties": {}})
-        property_email = PropertyEmailStream(self._tap, schema={"properties": {}})
-        property_postalmail = PropertyPostalMailStream(
-            self._tap, schema={"properties": {}}
-        )
-        property_call = PropertyCallStream(self._tap, schema={"properties": {}})
-        property_meeting = PropertyMeetingStream(self._tap, schema={"properties": {}})
-        property_task = PropertyTaskStream(self._tap, schema={"properties": {}})
-        property_communication = PropertyCommunicationStream(
-            self._tap, schema={"properties": {}}
-        )
-        property_records = (
-            list(property_ticket.get_records(context))
-            + list(property_deal.get_records(context))
-            + list(property_contact.get_records(context))
-            + list(property_company.get_records(context))
-            + list(property_product.get_records(context))
-            + list(property_lineitem.get_records(context))
-            + list(property_email.get_records(context))
-            + list(property_postalmail.get_records(context))
-            + list(property_call.get_records(context))
-            + list(property_meeting.get_records(context))
-            + list(property_task.get_records(context))
-            + list(property_communication.get_records(context))
-            + list(super().get_records(context))
-        )
-
-        return property_records
+        substreams = self._substreams
+        get_note_records = super().get_records
+
+        # Each object type is an independent request, so fetch them all at once
+        # and emit the results in the same order as before. Futures are dropped
+        # once yielded so finished object types can be garbage collected.
+        max_workers = min(len(substreams) + 1, POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = deque(
+                executor.submit(lambda stream=stream: list(stream.get_records(context)))
+                for stream in substreams
+            )
+            futures.append(executor.submit(lambda: list(get_note_records(context))))
+            while futures:
+                yield from futures.popleft().result()
 
 
 class CompanyStream(DynamicIncrementalHubspotStream):
@@ -1227,17 +317,8 @@ class CompanyStream(DynamicIncrementalHubspotStream):
     name = "companies"
     path = "/objects/companies"
     incremental_path = "/objects/companies/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class DealStream(DynamicIncrementalHubspotStream):
@@ -1257,20 +338,11 @@ class DealStream(DynamicIncrementalHubspotStream):
     name = "deals"
     path = "/objects/deals"
     incremental_path = "/objects/deals/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
 
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
-
-class FeedbackSubmissionsStream(HubspotStream):
+class FeedbackSubmissionsStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/feedback-submissions
     """
@@ -1286,38 +358,9 @@ class FeedbackSubmissionsStream(HubspotStream):
 
     name = "feedback_submissions"
     path = "/objects/feedback_submissions"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("city", StringType),
-                Property("createdDate", StringType),
-                Property("domain", StringType),
-                Property("hs_lastmodifieddate", StringType),
-                Property("industry", StringType),
-                Property("name", StringType),
-                Property("phone", StringType),
-                Property("state", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
-class LineItemStream(HubspotStream):
+class LineItemStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/line-items
     """
@@ -1333,38 +376,9 @@ class LineItemStream(HubspotStream):
 
     name = "line_items"
     path = "/objects/line_items"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("createdate", StringType),
-                Property("hs_lastmodifieddate", StringType),
-                Property("hs_product_id", StringType),
-                Property("hs_recurring_billing_period", StringType),
-                Property("name", StringType),
-                Property("price", StringType),
-                Property("quantity", StringType),
-                Property("recurringbillingfrequency", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
-class ProductStream(HubspotStream):
+class ProductStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/products
     """
@@ -1380,38 +394,9 @@ class ProductStream(HubspotStream):
 
     name = "products"
     path = "/objects/products"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("createdate", StringType),
-                Property("description", StringType),
-                Property("hs_cost_of_goods_sold", StringType),
-                Property("hs_lastmodifieddate", StringType),
-                Property("hs_recurring_billing_period", StringType),
-                Property("hs_sku", StringType),
-                Property("name", StringType),
-                Property("price", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
-class TicketStream(HubspotStream):
+class TicketStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/tickets
     """
@@ -1427,37 +412,9 @@ class TicketStream(HubspotStream):
 
     name = "tickets"
     path = "/objects/tickets"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("createdate", StringType),
-                Property("hs_lastmodifieddate", StringType),
-                Property("hs_pipeline", StringType),
-                Property("hs_pipeline_stage", StringType),
-                Property("hs_ticket_priority", StringType),
-                Property("hubspot_owner_id", StringType),
-                Property("subject", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
-
-class QuoteStream(HubspotStream):
+class QuoteStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/quotes
     """
@@ -1473,38 +430,9 @@ class QuoteStream(HubspotStream):
 
     name = "quotes"
     path = "/objects/quotes"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("hs_createdate", StringType),
-                Property("hs_expiration_date", StringType),
-                Property("hs_quote_amount", StringType),
-                Property("hs_quote_number", StringType),
-                Property("hs_status", StringType),
-                Property("hs_terms", StringType),
-                Property("hs_title", StringType),
-                Property("hubspot_owner_id", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
-class GoalStream(HubspotStream):
+class GoalStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/goals
     """
@@ -1520,34 +448,6 @@ class GoalStream(HubspotStream):
 
     name = "goals"
     path = "/objects/goal_targets"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("createdate", StringType),
-                Property("hs_created_by_user_id", StringType),
-                Property("hs_end_datetime", StringType),
-                Property("hs_goal_name", StringType),
-                Property("hs_lastmodifieddate", StringType),
-                Property("hs_start_datetime", StringType),
-                Property("hs_target_amount", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class CallStream(DynamicIncrementalHubspotStream):
@@ -1567,17 +467,8 @@ class CallStream(DynamicIncrementalHubspotStream):
     name = "calls"
     path = "/objects/calls"
     incremental_path = "/objects/calls/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class CommunicationStream(DynamicIncrementalHubspotStream):
@@ -1597,20 +488,11 @@ class CommunicationStream(DynamicIncrementalHubspotStream):
     name = "communications"
     path = "/objects/communications"
     incremental_path = "/objects/communications/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
-class EmailStream(HubspotStream):
+class EmailStream(CrmHubspotStream):
     """
     https://developers.hubspot.com/docs/api/crm/email
     """
@@ -1626,41 +508,6 @@ class EmailStream(HubspotStream):
 
     name = "emails"
     path = "/objects/emails"
-    primary_keys = ["id"]
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("createdate", StringType),
-                Property("hs_email_direction", StringType),
-                Property("hs_email_sender_email", StringType),
-                Property("hs_email_sender_firstname", StringType),
-                Property("hs_email_sender_lastname", StringType),
-                Property("hs_email_status", StringType),
-                Property("hs_email_subject", StringType),
-                Property("hs_email_text", StringType),
-                Property("hs_email_to_email", StringType),
-                Property("hs_email_to_firstname", StringType),
-                Property("hs_email_to_lastname", StringType),
-                Property("hs_lastmodifieddate", StringType),
-                Property("hs_timestamp", StringType),
-                Property("hubspot_owner_id", StringType),
-            ),
-        ),
-        Property("createdAt", StringType),
-        Property("updatedAt", StringType),
-        Property("archived", BooleanType),
-    ).to_dict()
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class MeetingStream(DynamicIncrementalHubspotStream):
@@ -1680,17 +527,8 @@ class MeetingStream(DynamicIncrementalHubspotStream):
     name = "meetings"
     path = "/objects/meetings"
     incremental_path = "/objects/meetings/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class NoteStream(DynamicIncrementalHubspotStream):
@@ -1710,17 +548,8 @@ class NoteStream(DynamicIncrementalHubspotStream):
     name = "notes"
     path = "/objects/notes"
     incremental_path = "/objects/notes/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class PostalMailStream(DynamicIncrementalHubspotStream):
@@ -1740,17 +569,8 @@ class PostalMailStream(DynamicIncrementalHubspotStream):
     name = "postal_mail"
     path = "/objects/postal_mail"
     incremental_path = "/objects/postal_mail/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
 
 
 class TaskStream(DynamicIncrementalHubspotStream):
@@ -1770,14 +590,5 @@ class TaskStream(DynamicIncrementalHubspotStream):
     name = "tasks"
     path = "/objects/tasks"
     incremental_path = "/objects/tasks/search"
-    primary_keys = ["id"]
     replication_key = "hs_lastmodifieddate"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$[results][*]"  # Or override `parse_response`.
-
-    @property
-    def url_base(self) -> str:
-        """
-        Returns an updated path which includes the api version
-        """
-        return "https://api.hubapi.com/crm/v3"
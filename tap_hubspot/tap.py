@@ -48,6 +48,15 @@ class TapHubspot(Tap):
             th.DateTimeType,
             description="Latest record date to sync",
         ),
+        th.Property(
+            "page_size",
+            th.IntegerType,
+            default=100,
+            description=(
+                "Number of records to request per page, between 1 and 100 "
+                "(the HubSpot maximum)"
+            ),
+        ),
     ).to_dict()
 
     def discover_streams(self) -> list[streams.HubspotStream]:
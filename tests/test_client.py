@@ -0,0 +1,90 @@
+"""Offline tests for the HubspotStream base class."""
+
+from __future__ import annotations
+
+import datetime
+import io
+import json
+import sys
+from decimal import Decimal
+
+import pytest
+from singer_sdk._singerlib import RecordMessage
+from singer_sdk._singerlib.messages import format_message
+
+from tap_hubspot.client import _write_record_line
+from tap_hubspot.streams import UsersStream
+from tap_hubspot.tap import TapHubspot
+
+
+class _OfflineTap(TapHubspot):
+    """Tap without stream discovery, so no HubSpot request is made."""
+
+    def discover_streams(self) -> list:
+        return []
+
+
+def _stream(**config) -> UsersStream:
+    return UsersStream(_OfflineTap(config={"access_token": "token", **config}))
+
+
+def test_page_size_defaults_to_hubspot_maximum():
+    assert _stream().page_size == 100
+    assert _stream().get_url_params(None, None)["limit"] == 100
+
+
+def test_page_size_from_config():
+    assert _stream(page_size=25).get_url_params(None, None)["limit"] == 25
+
+
+@pytest.mark.parametrize("page_size", [0, -1, 101])
+def test_page_size_out_of_range(page_size):
+    with pytest.raises(ValueError, match="page_size"):
+        _stream(page_size=page_size).page_size
+
+
+def test_record_line_matches_sdk_message(monkeypatch):
+    extracted = datetime.datetime(2023, 10, 1, 12, 30, tzinfo=datetime.timezone.utc)
+    messages = [
+        RecordMessage(stream="users", record={"id": "1", "email": "a@example.com"}),
+        RecordMessage(
+            stream="users",
+            record={
+                "id": "2",
+                "name": "Zoë Ångström 日本",
+                "updatedAt": datetime.datetime(2023, 10, 2, 8, 0),
+                "amount": Decimal("10.10"),
+                "properties": {"nested": [1, None, True]},
+            },
+            version=3,
+            time_extracted=extracted,
+        ),
+        RecordMessage(stream="owners", record={"id": "3"}, time_extracted=extracted),
+    ]
+    buffer = io.BytesIO()
+    stdout = io.TextIOWrapper(io.BufferedWriter(buffer), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    for message in messages:
+        _write_record_line(message)
+    stdout.flush()
+
+    lines = buffer.getvalue().decode("utf-8").splitlines()
+    # Written by orjson rather than the SDK fallback: raw UTF-8, exact decimals
+    assert "Zoë Ångström 日本" in lines[1]
+    assert '"amount":10.10' in lines[1]
+    assert [json.loads(line) for line in lines] == [
+        json.loads(format_message(message)) for message in messages
+    ]
+
+
+def test_record_line_without_buffered_stdout(monkeypatch):
+    # Under `python -u` stdout sits on a raw FileIO, so the SDK writer is used
+    message = RecordMessage(stream="users", record={"id": "1", "name": "Zoë"})
+    buffer = io.BytesIO()
+    stdout = io.TextIOWrapper(buffer, encoding="utf-8", write_through=True)
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    _write_record_line(message)
+
+    assert buffer.getvalue().decode("utf-8") == format_message(message) + "\n"
@@ -0,0 +1,116 @@
+"""Offline tests for the merged property stream."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from singer_sdk.exceptions import FatalAPIError
+
+from tap_hubspot.streams import PropertyNotesStream
+from tap_hubspot.tap import TapHubspot
+
+# Endpoints merged into the properties stream, in the order they are emitted
+PROPERTY_PATHS = [
+    "/properties/tickets",
+    "/properties/deals",
+    "/properties/contacts",
+    "/properties/company",
+    "/properties/product",
+    "/properties/line_item",
+    "/properties/email",
+    "/properties/postal_mail",
+    "/properties/call",
+    "/properties/meeting",
+    "/properties/task",
+    "/properties/communication",
+    "/properties/notes",
+]
+
+
+class _OfflineTap(TapHubspot):
+    """Tap without stream discovery, so no HubSpot request is made."""
+
+    def discover_streams(self) -> list:
+        return []
+
+
+class _FakeHubSpot:
+    """Serve two pages of property definitions for every endpoint."""
+
+    def __init__(
+        self,
+        failing_path: str | None = None,
+        slow_path: str | None = None,
+    ) -> None:
+        self.failing_path = failing_path
+        self.slow_path = slow_path
+        self.requests: list[requests.PreparedRequest] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs) -> requests.Response:
+        with self._lock:
+            self.requests.append(request)
+            self.threads.add(threading.current_thread().name)
+        path = request.path_url.split("?")[0].split("/crm/v3", 1)[1]
+        if path == self.slow_path:
+            time.sleep(0.1)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if path == self.failing_path:
+            response.status_code = 400
+            response._content = b'{"message": "bad request"}'
+            return response
+        if "after=" in request.path_url:
+            body = {"results": [{"label": f"{path} 2", "name": "b"}]}
+        else:
+            body = {
+                "results": [{"label": f"{path} 1", "name": "a"}],
+                "paging": {"next": {"after": "1"}},
+            }
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        return response
+
+
+@pytest.fixture
+def stream() -> PropertyNotesStream:
+    return PropertyNotesStream(_OfflineTap(config={"access_token": "token"}))
+
+
+def test_records_keep_endpoint_order(monkeypatch, stream):
+    # The first endpoint finishes last, yet its records are still emitted first
+    hubspot = _FakeHubSpot(slow_path=PROPERTY_PATHS[0])
+    monkeypatch.setattr(HTTPAdapter, "send", hubspot.send)
+
+    records = list(stream.get_records(None))
+
+    assert [record["label"] for record in records] == [
+        f"{path} {page}" for path in PROPERTY_PATHS for page in (1, 2)
+    ]
+    assert len(hubspot.requests) == 2 * len(PROPERTY_PATHS)
+    assert len(hubspot.threads) > 1
+
+
+def test_every_request_is_authenticated(monkeypatch, stream):
+    hubspot = _FakeHubSpot()
+    monkeypatch.setattr(HTTPAdapter, "send", hubspot.send)
+
+    list(stream.get_records(None))
+
+    assert {r.headers.get("Authorization") for r in hubspot.requests} == {
+        "Bearer token"
+    }
+
+
+def test_worker_error_reaches_caller(monkeypatch, stream):
+    monkeypatch.setattr(HTTPAdapter, "send", _FakeHubSpot("/properties/deals").send)
+
+    with pytest.raises(FatalAPIError):
+        list(stream.get_records(None))